@@ -1,48 +1,34 @@
+import asyncio
+import threading
 import streamlit as st
 import logging
-from langchain_groq import ChatGroq
-from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
-from langchain_classic.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_classic.schema import HumanMessage, AIMessage
-from tools.streamlit_tools import get_tools
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from logger import setup_logger
 
 logger = setup_logger(__name__)
 
+STREAM_BATCH_MAX_TOKENS = 25
+STREAM_BATCH_GROWTH = 3
+CHAT_HISTORY_WINDOW = 20
 
-def init_session_state():
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-    if "agent_executor" not in st.session_state:
-        st.session_state.agent_executor = None
-
-
-def create_agent(groq_api_key: str, binance_api_key: str, binance_api_secret: str):
-    logger.info(f"Creating Streamlit agent with model: llama-3.3-70b-versatile")
-    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0, api_key=groq_api_key)
+# The system prompt here embeds the user's Binance credentials, so repeated
+# LLM calls are cached in memory only and never persisted to disk.
+set_llm_cache(InMemoryCache(maxsize=1024))
 
-    tools = get_tools()
-    logger.debug(f"Loaded {len(tools)} Streamlit tools")
-
-    # Add API keys to each tool call
-    def add_api_keys_to_agent():
-        pass
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are a Binance Futures trading assistant. You help users place orders and check their account information on the Binance Futures Testnet.
+# The static instructions come first and are identical for every session so the
+# provider's prompt prefix cache can reuse them; per-session credentials go last.
+SYSTEM_PROMPT = """You are a Binance Futures trading assistant. You help users place orders and check their account information on the Binance Futures Testnet.
 
 Available tools:
 - place_market_order: Place MARKET orders (BUY or SELL). Requires: symbol, side, quantity, api_key, api_secret
 - place_limit_order: Place LIMIT orders with a specified price. Requires: symbol, side, quantity, price, api_key, api_secret
 - get_account_balance: Check account balance. Requires: api_key, api_secret
 - get_position_info: Get position information for a trading pair. Requires: symbol, api_key, api_secret
-
-IMPORTANT: Always pass these parameters when calling tools:
-- api_key: {binance_api_key}
-- api_secret: {binance_api_secret}
+- get_positions_info: Get position information for several trading pairs at once. Requires: symbols_csv (comma-separated), api_key, api_secret
+- batch: Run several independent tool calls at once. Requires: invocations (each with tool_name and arguments, including api_key and api_secret)
 
 When users want to place an order:
 1. Ask for all required parameters if not provided
@@ -50,25 +36,118 @@ When users want to place an order:
 3. Use the appropriate tool to place the order
 4. Report the result
 
-Be concise and professional in your responses.""".format(
-                    binance_api_key=binance_api_key,
-                    binance_api_secret=binance_api_secret,
-                ),
-            ),
-            MessagesPlaceholder(variable_name="chat_history", optional=True),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ]
-    )
+When the user requests multiple independent operations (e.g. checking the balance and a position), emit one batch call containing all of them instead of separate calls.
+
+Be concise and professional in your responses."""
+
+CREDENTIALS_PROMPT = """
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
-    agent_executor = AgentExecutor(
-        agent=agent, tools=tools, verbose=True, handle_parsing_errors=True
+IMPORTANT: Always pass these parameters when calling tools:
+- api_key: {binance_api_key}
+- api_secret: {binance_api_secret}"""
+
+# Parsed once at import; the credentials stay template variables and are bound
+# per agent with .partial() instead of being formatted into the prompt text.
+BASE_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", SYSTEM_PROMPT + CREDENTIALS_PROMPT),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ]
+)
+
+
+def init_session_state():
+    if "messages" not in st.session_state:
+        st.session_state.messages = []
+    if "agent_executor" not in st.session_state:
+        st.session_state.agent_executor = None
+
+
+# The executor holds no per-conversation state (chat history is passed on each
+# invoke), so one instance per key triple is shared across reruns and sessions.
+@st.cache_resource(show_spinner=False, ttl=24 * 60 * 60)
+def create_agent(groq_api_key: str, binance_api_key: str, binance_api_secret: str):
+    # Heavy LangChain/Groq imports are deferred until an agent is actually built.
+    from langchain_groq import ChatGroq
+    from parallel_executor import build_agent_executor
+    from tools.streamlit_tools import get_tools
+
+    logger.info(f"Creating Streamlit agent with model: llama-3.3-70b-versatile")
+    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0, api_key=groq_api_key)
+
+    prompt = BASE_PROMPT.partial(
+        binance_api_key=binance_api_key, binance_api_secret=binance_api_secret
     )
+    agent_executor = build_agent_executor(llm, get_tools(), prompt)
 
     return agent_executor
 
 
+# Streamlit drives async generators on a fresh event loop per call, but the
+# cached executor's Groq client keeps its connections on the loop that opened
+# them. All agent work therefore runs on one long-lived background loop.
+@st.cache_resource(show_spinner=False)
+def get_agent_loop() -> asyncio.AbstractEventLoop:
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-loop", daemon=True).start()
+    return loop
+
+
+def iterate_on_loop(agen, loop: asyncio.AbstractEventLoop):
+    # Synchronous view of an async generator whose steps run on `loop`.
+    try:
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(agen.__anext__(), loop).result()
+            except StopAsyncIteration:
+                return
+    finally:
+        asyncio.run_coroutine_threadsafe(agen.aclose(), loop).result()
+
+
+async def stream_agent_response(agent_executor, inputs: dict, result: dict):
+    # Emit the first token on its own for a fast first paint, then coalesce
+    # progressively larger batches to cut the number of Streamlit updates.
+    # The executor's final answer is stored in result["output"] and appended
+    # when it wasn't streamed (cached answers, early-stop messages).
+    buffer = []
+    batch_size = 1
+    streamed = []
+    last_run_id = None
+    async for event in agent_executor.astream_events(inputs, version="v2"):
+        if event["event"] == "on_chain_end" and not event["parent_ids"]:
+            result["output"] = event["data"]["output"].get("output", "")
+            continue
+
+        if event["event"] != "on_chat_model_stream":
+            continue
+
+        content = event["data"]["chunk"].content
+        if not content:
+            continue
+
+        # Keep text from separate model turns apart instead of gluing it.
+        if streamed and event["run_id"] != last_run_id:
+            content = "\n\n" + content
+        last_run_id = event["run_id"]
+        streamed.append(content)
+
+        buffer.append(content)
+        if len(buffer) >= batch_size:
+            yield "".join(buffer)
+            buffer.clear()
+            batch_size = min(batch_size * STREAM_BATCH_GROWTH, STREAM_BATCH_MAX_TOKENS)
+
+    if buffer:
+        yield "".join(buffer)
+
+    output = result.get("output")
+    if output and not "".join(streamed).endswith(output):
+        yield "\n\n" + output if streamed else output
+
+
 def display_message(role: str, content: str):
     with st.chat_message(role):
         st.markdown(content)
@@ -146,33 +225,49 @@ def main():
 
     if prompt := st.chat_input("Type your message here..."):
         logger.debug(f"User input received: {prompt[:100]}...")
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        st.session_state.messages.append(
+            {"role": "user", "content": prompt, "lc": HumanMessage(content=prompt)}
+        )
         display_message("user", prompt)
 
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 try:
-                    chat_history = []
-                    for msg in st.session_state.messages[:-1]:
-                        if msg["role"] == "user":
-                            chat_history.append(HumanMessage(content=msg["content"]))
-                        else:
-                            chat_history.append(AIMessage(content=msg["content"]))
+                    # Reuse the stored LangChain messages and only send the most
+                    # recent turns, so per-turn work doesn't grow with the chat.
+                    chat_history = [
+                        msg["lc"]
+                        for msg in st.session_state.messages[
+                            -CHAT_HISTORY_WINDOW - 1 : -1
+                        ]
+                    ]
 
                     logger.debug(
                         f"Invoking agent with chat history of {len(chat_history)} messages"
                     )
-                    response = st.session_state.agent_executor.invoke(
-                        {"input": prompt, "chat_history": chat_history}
+                    result = {}
+                    streamed_response = st.write_stream(
+                        iterate_on_loop(
+                            stream_agent_response(
+                                st.session_state.agent_executor,
+                                {"input": prompt, "chat_history": chat_history},
+                                result,
+                            ),
+                            get_agent_loop(),
+                        )
                     )
-
-                    assistant_response = response["output"]
+                    # History keeps the executor's final answer, not the
+                    # concatenated text of every model turn.
+                    assistant_response = result.get("output") or streamed_response
                     logger.info(
                         f"Agent response received: {assistant_response[:100]}..."
                     )
-                    st.markdown(assistant_response)
                     st.session_state.messages.append(
-                        {"role": "assistant", "content": assistant_response}
+                        {
+                            "role": "assistant",
+                            "content": assistant_response,
+                            "lc": AIMessage(content=assistant_response),
+                        }
                     )
 
                 except Exception as e:
@@ -180,7 +275,11 @@ def main():
                     error_message = f"❌ Error: {str(e)}"
                     st.error(error_message)
                     st.session_state.messages.append(
-                        {"role": "assistant", "content": error_message}
+                        {
+                            "role": "assistant",
+                            "content": error_message,
+                            "lc": AIMessage(content=error_message),
+                        }
                     )
 
 
@@ -1,7 +1,5 @@
-from tools.binance_tools import tools
-from langchain_groq import ChatGroq
-from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
-from langchain_classic.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+import asyncio
 import os
 from dotenv import load_dotenv
 from logger import setup_logger
@@ -9,28 +7,19 @@ from logger import setup_logger
 logger = setup_logger(__name__)
 load_dotenv()
 
+BATCH_MAX_CONCURRENCY = 10
 
-def create_agent():
-    groq_api_key = os.getenv("GROQ_API_KEY")
-
-    if not groq_api_key:
-        logger.error("GROQ_API_KEY environment variable is required")
-        raise ValueError("GROQ_API_KEY environment variable is required")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".langchain.db")
 
-    logger.info(f"Creating Groq agent with model: llama-3.3-70b-versatile")
-    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0, api_key=groq_api_key)
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            (
-                "system",
-                """You are a Binance Futures trading assistant. You help users place orders and check their account information on the Binance Futures Testnet.
+SYSTEM_PROMPT = """You are a Binance Futures trading assistant. You help users place orders and check their account information on the Binance Futures Testnet.
 
 Available tools:
 - place_market_order: Place MARKET orders (BUY or SELL)
 - place_limit_order: Place LIMIT orders with a specified price
 - get_account_balance: Check account balance
 - get_position_info: Get position information for a trading pair
+- get_positions_info: Get position information for several trading pairs at once (comma-separated symbols)
+- batch: Run several independent tool calls at once.
 
 When users want to place an order:
 1. Ask for all required parameters if not provided
@@ -38,22 +27,79 @@ When users want to place an order:
 3. Use the appropriate tool to place the order
 4. Report the result
 
-Be concise and professional in your responses.""",
-            ),
-            MessagesPlaceholder(variable_name="chat_history", optional=True),
-            ("human", "{input}"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ]
-    )
+When the user requests multiple independent operations (e.g. checking the balance and a position), emit one batch call containing all of them instead of separate calls.
 
-    agent = create_tool_calling_agent(llm, tools, prompt)
-    agent_executor = AgentExecutor(
-        agent=agent, tools=tools, verbose=True, handle_parsing_errors=True
-    )
+Be concise and professional in your responses."""
+
+# Built once at import; the system message is static so every turn shares the
+# same prompt prefix and the provider's prompt cache can reuse it.
+PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", SYSTEM_PROMPT),
+        MessagesPlaceholder(variable_name="chat_history", optional=True),
+        ("human", "{input}"),
+        MessagesPlaceholder(variable_name="agent_scratchpad"),
+    ]
+)
+
+
+def setup_llm_cache():
+    # temperature=0 makes repeated prompts deterministic, so identical LLM calls
+    # are answered from a local SQLite cache. Set LLM_CACHE_PATH= to disable.
+    if not LLM_CACHE_PATH:
+        return
+
+    from langchain_community.cache import SQLiteCache
+    from langchain_core.globals import set_llm_cache
+
+    set_llm_cache(SQLiteCache(database_path=LLM_CACHE_PATH))
+
+
+def create_agent():
+    groq_api_key = os.getenv("GROQ_API_KEY")
+
+    if not groq_api_key:
+        logger.error("GROQ_API_KEY environment variable is required")
+        raise ValueError("GROQ_API_KEY environment variable is required")
+
+    # Heavy LangChain/Groq imports are deferred until an agent is actually built.
+    from langchain_groq import ChatGroq
+    from parallel_executor import build_agent_executor
+    from tools.binance_tools import get_tools
+
+    setup_llm_cache()
+
+    logger.info(f"Creating Groq agent with model: llama-3.3-70b-versatile")
+    llm = ChatGroq(model="llama-3.3-70b-versatile", temperature=0, api_key=groq_api_key)
+
+    agent_executor = build_agent_executor(llm, get_tools(), PROMPT)
 
     return agent_executor
 
 
+async def run_batch(prompts: list[str]) -> list[dict]:
+    agent_executor = create_agent()
+    logger.info(f"Running batch of {len(prompts)} prompts")
+
+    responses = await agent_executor.abatch(
+        [{"input": prompt, "chat_history": []} for prompt in prompts],
+        config={"max_concurrency": BATCH_MAX_CONCURRENCY},
+        return_exceptions=True,
+    )
+
+    results = []
+    for prompt, response in zip(prompts, responses):
+        if isinstance(response, Exception):
+            logger.error(f"Error processing batch prompt: {str(response)}")
+            results.append({"input": prompt, "output": None, "error": str(response)})
+        else:
+            results.append(
+                {"input": prompt, "output": response["output"], "error": None}
+            )
+
+    return results
+
+
 def main():
     logger.info("Starting Binance Futures Trading Assistant")
     print("🤖 Binance Futures Trading Assistant (Groq)")
@@ -62,32 +108,38 @@ def main():
     agent_executor = create_agent()
     chat_history = []
 
-    while True:
-        user_input = input("You: ").strip()
+    # Every turn runs on the same event loop, since the Groq client keeps its
+    # keep-alive connections on the loop that opened them. input() stays on
+    # the main thread so Ctrl-C at the prompt exits immediately.
+    with asyncio.Runner() as runner:
+        while True:
+            user_input = input("You: ").strip()
 
-        if user_input.lower() in ["exit", "quit"]:
-            logger.info("User requested to exit")
-            print("Goodbye! 👋")
-            break
+            if user_input.lower() in ["exit", "quit"]:
+                logger.info("User requested to exit")
+                print("Goodbye! 👋")
+                break
 
-        if not user_input:
-            continue
+            if not user_input:
+                continue
 
-        logger.debug(f"User input: {user_input}")
+            logger.debug(f"User input: {user_input}")
 
-        try:
-            response = agent_executor.invoke(
-                {"input": user_input, "chat_history": chat_history}
-            )
+            try:
+                response = runner.run(
+                    agent_executor.ainvoke(
+                        {"input": user_input, "chat_history": chat_history}
+                    )
+                )
 
-            print(f"\nAssistant: {response['output']}\n")
+                print(f"\nAssistant: {response['output']}\n")
 
-            chat_history.append(("human", user_input))
-            chat_history.append(("ai", response["output"]))
+                chat_history.append(("human", user_input))
+                chat_history.append(("ai", response["output"]))
 
-        except Exception as e:
-            logger.error(f"Error processing user input: {str(e)}")
-            print(f"\n❌ Error: {str(e)}\n")
+            except Exception as e:
+                logger.error(f"Error processing user input: {str(e)}")
+                print(f"\n❌ Error: {str(e)}\n")
 
 
 if __name__ == "__main__":
@@ -1,70 +1,156 @@
 import os
+import re
 import logging
 from dataclasses import dataclass
 from typing import Optional
 import time
-from functools import wraps
+import random
+from functools import lru_cache, wraps
 
 from binance.client import Client
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from binance.enums import *
-from binance.exceptions import BinanceAPIException
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from logger import setup_logger
 
 logger = setup_logger(__name__)
 
+POOL_SIZE = 32
+# Only a handful of hosts are ever contacted (fapi / testnet), so few pools.
+POOL_CONNECTIONS = 4
+# Connection-level retries cover only failed connects: a request that never
+# reached Binance is safe to resend, while read/status errors are left to
+# RetryOnError so orders are never sent twice by the transport.
+CONNECT_RETRIES = Retry(total=2, connect=2, read=0, status=0, other=0)
+MAX_RETRY_DELAY = 30
+
+ORDER_SIDES = frozenset({"BUY", "SELL"})
+ORDER_TYPES = frozenset({"MARKET", "LIMIT"})
+
+RETRYABLE_STATUS_CODES = frozenset({502, 503, 504})
+_RETRYABLE_MESSAGE = re.compile(r"50[234]|Bad Gateway")
+
+
+def is_retryable_error(e: BinanceAPIException, error_msg: str) -> bool:
+    if getattr(e, "status_code", None) in RETRYABLE_STATUS_CODES:
+        return True
+    return _RETRYABLE_MESSAGE.search(error_msg) is not None
+
 
-def retry_on_error(max_retries=3, delay=1):
-    def decorator(func):
+class RetryOnError:
+    """Retry decorator for Binance calls.
+
+    Retries 502/503/504 API errors and unexpected exceptions with
+    decorrelated-jitter backoff (each wait is drawn from [delay, 3 * previous
+    wait], capped at max_delay) so concurrent callers don't retry in lockstep;
+    other Binance API errors are raised immediately.
+    """
+
+    def __init__(self, max_retries=3, delay=1, max_delay=MAX_RETRY_DELAY):
+        self.max_retries = max_retries
+        self.delay = delay
+        self.max_delay = max_delay
+
+    def __call__(self, func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            last_exception = None
-            for attempt in range(max_retries):
+            wait_time = self.delay
+            for attempt in range(self.max_retries):
                 try:
                     return func(*args, **kwargs)
-                except BinanceAPIException as e:
-                    last_exception = e
-                    error_msg = str(e.message) if hasattr(e, "message") else str(e)
-                    if (
-                        "502" in error_msg
-                        or "503" in error_msg
-                        or "504" in error_msg
-                        or "Bad Gateway" in error_msg
-                    ):
-                        if attempt < max_retries - 1:
-                            wait_time = delay * (attempt + 1)
-                            logger.warning(
-                                f"API error (attempt {attempt + 1}/{max_retries}): {error_msg}. "
-                                f"Retrying in {wait_time}s..."
-                            )
-                            time.sleep(wait_time)
-                            continue
-                        else:
-                            logger.error(
-                                f"API error after {max_retries} attempts: {error_msg}"
-                            )
-                    raise
                 except Exception as e:
-                    if attempt < max_retries - 1:
-                        wait_time = delay * (attempt + 1)
-                        logger.warning(
-                            f"Unexpected error (attempt {attempt + 1}/{max_retries}): {str(e)}. "
-                            f"Retrying in {wait_time}s..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-                    raise e
-            if last_exception:
-                logger.error(f"All retry attempts failed")
-                raise last_exception
+                    wait_time = self._retry_delay(e, attempt, wait_time)
+                    if wait_time is None:
+                        raise
+                    time.sleep(wait_time)
             raise Exception("Unknown error occurred")
 
         return wrapper
 
-    return decorator
+    def _retry_delay(
+        self, e: Exception, attempt: int, prev_wait: float
+    ) -> Optional[float]:
+        is_last_attempt = attempt >= self.max_retries - 1
+        wait_time = min(self.max_delay, random.uniform(self.delay, prev_wait * 3))
+
+        if isinstance(e, BinanceAPIException):
+            error_msg = getattr(e, "message", None) or str(e)
+            if not is_retryable_error(e, error_msg):
+                return None
+            if is_last_attempt:
+                logger.error(
+                    "API error after %d attempts: %s", self.max_retries, error_msg
+                )
+                return None
+            logger.warning(
+                "API error (attempt %d/%d): %s. Retrying in %.2fs...",
+                attempt + 1,
+                self.max_retries,
+                error_msg,
+                wait_time,
+            )
+            return wait_time
+
+        if is_last_attempt:
+            return None
+        logger.warning(
+            "Unexpected error (attempt %d/%d): %s. Retrying in %.2fs...",
+            attempt + 1,
+            self.max_retries,
+            e,
+            wait_time,
+        )
+        return wait_time
+
+
+retry_on_error = RetryOnError
+
+
+def _handle_response_orjson(response):
+    # Same contract as Client._handle_response, but decodes with orjson.
+    if not (200 <= response.status_code < 300):
+        raise BinanceAPIException(response, response.status_code, response.text)
+
+    if not response.content:
+        return {}
+
+    try:
+        return orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        raise BinanceRequestException("Invalid Response: %s" % response.text)
+
+
+# Clients are shared per credential set so repeated BinanceFuturesClient
+# construction reuses the same HTTP session and its keep-alive connections.
+@lru_cache(maxsize=8)
+def _make_client(api_key: str, api_secret: str, testnet: bool) -> Client:
+    client = Client(api_key, api_secret, testnet=testnet)
+    client.session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_SIZE,
+            max_retries=CONNECT_RETRIES,
+        ),
+    )
+
+    if testnet:
+        client.FUTURES_URL = "https://testnet.binancefuture.com"
+
+    if orjson is not None:
+        client._handle_response = _handle_response_orjson
 
+    return client
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class OrderRequest:
     symbol: str
     side: str
@@ -72,86 +158,95 @@ class OrderRequest:
     quantity: float
     price: Optional[float] = None
 
+    def __post_init__(self):
+        is_valid, error_msg = self.validate()
+        if not is_valid:
+            logger.error("Order validation failed: %s", error_msg)
+            raise ValueError(error_msg)
+
     def validate(self) -> tuple[bool, Optional[str]]:
-        if not self.symbol:
-            return False, "Symbol is required"
+        error_msg = (
+            "Symbol is required"
+            if not self.symbol
+            else "Side must be BUY or SELL"
+            if self.side not in ORDER_SIDES
+            else "Order type must be MARKET or LIMIT"
+            if self.order_type not in ORDER_TYPES
+            else "Quantity must be greater than 0"
+            if self.quantity <= 0
+            else "Price is required for LIMIT orders and must be greater than 0"
+            if self.order_type == "LIMIT" and (self.price is None or self.price <= 0)
+            else None
+        )
+        if error_msg is not None:
+            return False, error_msg
 
-        if self.side not in ["BUY", "SELL"]:
-            return False, "Side must be BUY or SELL"
+        logger.debug(
+            "Order validation: symbol=%s, side=%s, type=%s, quantity=%s, price=%s",
+            self.symbol,
+            self.side,
+            self.order_type,
+            self.quantity,
+            self.price,
+        )
+        return True, None
 
-        if self.order_type not in ["MARKET", "LIMIT"]:
-            return False, "Order type must be MARKET or LIMIT"
 
-        if self.quantity <= 0:
-            return False, "Quantity must be greater than 0"
+def build_order_params(order: OrderRequest) -> dict:
+    params = {
+        "symbol": order.symbol,
+        "side": order.side,
+        "type": order.order_type,
+        "quantity": order.quantity,
+        "timeInForce": "GTC" if order.order_type == "LIMIT" else None,
+    }
 
-        if self.order_type == "LIMIT" and (self.price is None or self.price <= 0):
-            return (
-                False,
-                "Price is required for LIMIT orders and must be greater than 0",
-            )
+    if order.order_type == "LIMIT":
+        params["price"] = order.price
 
-        logger.debug(
-            f"Order validation: symbol={self.symbol}, side={self.side}, "
-            f"type={self.order_type}, quantity={self.quantity}, price={self.price}"
-        )
-        return True, None
+    if params["timeInForce"] is None:
+        params.pop("timeInForce")
+
+    return params
 
 
 class BinanceFuturesClient:
     def __init__(self, api_key: str, api_secret: str, testnet: bool = True):
         self.testnet = testnet
         base_url = "testnet" if testnet else "fapi"
-        logger.info(f"Initializing BinanceFuturesClient (network: {base_url})")
-        self.client = Client(api_key, api_secret, testnet=testnet)
+        logger.info("Initializing BinanceFuturesClient (network: %s)", base_url)
+        self.client = _make_client(api_key, api_secret, testnet)
         logger.debug("Binance client initialized successfully")
 
-        if testnet:
-            self.client.FUTURES_URL = "https://testnet.binancefuture.com"
-
     @retry_on_error(max_retries=3, delay=2)
     def place_order(self, order: OrderRequest) -> dict:
         logger.info(
-            f"Placing order: {order.side} {order.quantity} {order.symbol} ({order.order_type})"
+            "Placing order: %s %s %s (%s)",
+            order.side,
+            order.quantity,
+            order.symbol,
+            order.order_type,
         )
 
-        is_valid, error_msg = order.validate()
-        if not is_valid:
-            logger.error(f"Order validation failed: {error_msg}")
-            raise ValueError(error_msg)
-
-        params = {
-            "symbol": order.symbol,
-            "side": order.side,
-            "type": order.order_type,
-            "quantity": order.quantity,
-            "timeInForce": "GTC" if order.order_type == "LIMIT" else None,
-        }
-
-        if order.order_type == "LIMIT":
-            params["price"] = order.price
-
-        if params["timeInForce"] is None:
-            params.pop("timeInForce")
-
-        logger.debug(f"Order parameters: {params}")
+        params = build_order_params(order)
+        logger.debug("Order parameters: %s", params)
 
         try:
             response = self.client.futures_create_order(**params)
             logger.info(
-                f"Order placed successfully. Order ID: {response.get('orderId')}"
+                "Order placed successfully. Order ID: %s", response.get("orderId")
             )
             return {"success": True, "data": response, "error": None}
         except BinanceAPIException as e:
             error_msg = str(e.message) if hasattr(e, "message") else str(e)
-            logger.error(f"Binance API error: {error_msg} (code: {e.code})")
+            logger.error("Binance API error: %s (code: %s)", error_msg, e.code)
             return {
                 "success": False,
                 "data": None,
                 "error": {"code": e.code, "message": error_msg},
             }
         except Exception as e:
-            logger.error(f"Unexpected error placing order: {str(e)}")
+            logger.error("Unexpected error placing order: %s", e)
             return {
                 "success": False,
                 "data": None,
@@ -1,4 +1,5 @@
 import os
+import sys
 import logging
 from typing import Optional
 
@@ -27,37 +28,58 @@ class CLI:
         logger.info("CLI client initialized successfully")
         return BinanceFuturesClient(api_key, api_secret, testnet=True)
 
+    def _write(self, lines: list[str]):
+        # One write and flush per block instead of one per line.
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
     def _print_order_summary(self, order: OrderRequest):
-        print("\n=== Order Request Summary ===")
-        print(f"Symbol:    {order.symbol}")
-        print(f"Side:      {order.side}")
-        print(f"Type:      {order.order_type}")
-        print(f"Quantity:  {order.quantity}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        lines = [
+            "",
+            "=== Order Request Summary ===",
+            f"Symbol:    {order.symbol}",
+            f"Side:      {order.side}",
+            f"Type:      {order.order_type}",
+            f"Quantity:  {order.quantity}",
+        ]
         if order.order_type == "LIMIT":
-            print(f"Price:     {order.price}")
-        print("============================\n")
+            lines.append(f"Price:     {order.price}")
+        lines += ["============================", ""]
+        self._write(lines)
 
     def _print_order_response(self, response: dict):
         if response["success"]:
             data = response["data"]
-            print("=== Order Response ===")
-            print(f"Order ID:      {data.get('orderId', 'N/A')}")
-            print(f"Status:        {data.get('status', 'N/A')}")
-            print(f"Symbol:        {data.get('symbol', 'N/A')}")
-            print(f"Side:          {data.get('side', 'N/A')}")
-            print(f"Type:          {data.get('type', 'N/A')}")
-            print(f"Quantity:      {data.get('origQty', 'N/A')}")
-            print(f"Executed Qty:  {data.get('executedQty', 'N/A')}")
-            print(f"Avg Price:     {data.get('avgPrice', 'N/A')}")
-            print("======================")
-            print("\n✅ Order placed successfully!\n")
+            lines = [
+                "=== Order Response ===",
+                f"Order ID:      {data.get('orderId', 'N/A')}",
+                f"Status:        {data.get('status', 'N/A')}",
+                f"Symbol:        {data.get('symbol', 'N/A')}",
+                f"Side:          {data.get('side', 'N/A')}",
+                f"Type:          {data.get('type', 'N/A')}",
+                f"Quantity:      {data.get('origQty', 'N/A')}",
+                f"Executed Qty:  {data.get('executedQty', 'N/A')}",
+                f"Avg Price:     {data.get('avgPrice', 'N/A')}",
+                "======================",
+                "",
+                "✅ Order placed successfully!",
+                "",
+            ]
         else:
             error = response["error"]
-            print("=== Order Failed ===")
-            print(f"Error Code:    {error.get('code', 'N/A')}")
-            print(f"Error Message: {error.get('message', 'N/A')}")
-            print("====================")
-            print("\n❌ Failed to place order!\n")
+            lines = [
+                "=== Order Failed ===",
+                f"Error Code:    {error.get('code', 'N/A')}",
+                f"Error Message: {error.get('message', 'N/A')}",
+                "====================",
+                "",
+                "❌ Failed to place order!",
+                "",
+            ]
+        self._write(lines)
 
     def run(
         self,
@@ -1,24 +1,33 @@
 import logging
+import os
 import sys
-from datetime import datetime
+from typing import Optional
 
+# One formatter and console handler are shared by every module logger instead
+# of building a new pair per setup_logger() call.
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
+_CONSOLE_HANDLER = logging.StreamHandler(sys.stdout)
+_CONSOLE_HANDLER.setLevel(logging.DEBUG)
+_CONSOLE_HANDLER.setFormatter(_FORMATTER)
+
+
+def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     logger = logging.getLogger(name)
 
     if logger.handlers:
         return logger
 
+    level = level or os.getenv("LOG_LEVEL", "INFO")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.addHandler(_CONSOLE_HANDLER)
 
-    formatter = logging.Formatter(
-        fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    return logger
 
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
 
-    return logger
+def set_console_stream(stream) -> object:
+    # Redirect every module logger's console output; returns the old stream.
+    return _CONSOLE_HANDLER.setStream(stream)
@@ -1,24 +1,61 @@
+import asyncio
+import json
 import os
 import sys
 from dotenv import load_dotenv
 
-from cli import CLI
+
+def print_usage():
+    print("Usage: python main.py <SYMBOL> <SIDE> <ORDER_TYPE> <QUANTITY> [PRICE]")
+    print("       python main.py batch <PROMPTS_FILE>")
+    print("\nArguments:")
+    print("  SYMBOL      Trading pair (e.g., BTCUSDT)")
+    print("  SIDE        Order side: BUY or SELL")
+    print("  ORDER_TYPE   Order type: MARKET or LIMIT")
+    print("  QUANTITY     Order quantity")
+    print("  PRICE        Price (required for LIMIT orders)")
+    print("  PROMPTS_FILE JSONL file with one prompt per line (string or {\"input\": ...})\n")
+    print("\nExample:")
+    print("  python main.py BTCUSDT BUY MARKET 0.001")
+    print("  python main.py BTCUSDT SELL LIMIT 0.001 50000")
+    print("  python main.py batch prompts.jsonl\n")
+
+
+def load_prompts(path: str) -> list[str]:
+    prompts = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            prompts.append(record["input"] if isinstance(record, dict) else record)
+    return prompts
+
+
+def run_batch_command(path: str):
+    # stdout carries only the JSON result lines; console logs go to stderr.
+    from logger import set_console_stream
+
+    set_console_stream(sys.stderr)
+
+    from assistant import run_batch
+
+    prompts = load_prompts(path)
+    results = asyncio.run(run_batch(prompts))
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
 
 
 def main():
     load_dotenv()
 
+    if len(sys.argv) == 3 and sys.argv[1] == "batch":
+        run_batch_command(sys.argv[2])
+        return
+
     if len(sys.argv) < 5:
-        print("Usage: python main.py <SYMBOL> <SIDE> <ORDER_TYPE> <QUANTITY> [PRICE]")
-        print("\nArguments:")
-        print("  SYMBOL      Trading pair (e.g., BTCUSDT)")
-        print("  SIDE        Order side: BUY or SELL")
-        print("  ORDER_TYPE   Order type: MARKET or LIMIT")
-        print("  QUANTITY     Order quantity")
-        print("  PRICE        Price (required for LIMIT orders)\n")
-        print("\nExample:")
-        print("  python main.py BTCUSDT BUY MARKET 0.001")
-        print("  python main.py BTCUSDT SELL LIMIT 0.001 50000\n")
+        print_usage()
         sys.exit(1)
 
     symbol = sys.argv[1]
@@ -27,6 +64,9 @@ def main():
     quantity = float(sys.argv[4])
     price = float(sys.argv[5]) if len(sys.argv) > 5 else None
 
+    # Imported only once arguments are valid so usage errors return instantly.
+    from cli import CLI
+
     cli = CLI()
     cli.run(
         symbol=symbol, side=side, order_type=order_type, quantity=quantity, price=price
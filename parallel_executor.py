@@ -0,0 +1,73 @@
+import asyncio
+import os
+import weakref
+
+from langchain_classic.agents import AgentExecutor, create_tool_calling_agent
+from langchain_classic.agents.agent import RunnableMultiActionAgent
+
+from logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Clamped to at least 1: a zero-sized semaphore would hang every tool call,
+# since max_execution_time is only checked between agent iterations.
+TOOL_CONCURRENCY_LIMIT = max(1, int(os.getenv("TOOL_CONCURRENCY_LIMIT", "4")))
+
+# The batch meta-tool acquires a slot for each invocation it fans out, so the
+# executor does not hold one for the batch call itself (that could deadlock).
+BATCH_TOOL_NAME = "batch"
+
+_semaphores = weakref.WeakKeyDictionary()
+
+
+def get_tool_semaphore() -> asyncio.Semaphore:
+    # asyncio.Semaphore is bound to the loop it is first used on, and every
+    # asyncio.run() call creates a new loop, so keep one semaphore per loop.
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(TOOL_CONCURRENCY_LIMIT)
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+class ParallelAgentExecutor(AgentExecutor):
+    """AgentExecutor that runs the tool calls of one LLM turn concurrently.
+
+    The async path of AgentExecutor already gathers all actions returned by a
+    single plan step; this executor caps how many of them hit the Binance API at
+    once with TOOL_CONCURRENCY_LIMIT, including calls made through the batch
+    tool. Use it through ainvoke/abatch.
+    """
+
+    async def _aperform_agent_action(
+        self, name_to_tool_map, color_mapping, agent_action, run_manager=None
+    ):
+        if agent_action.tool == BATCH_TOOL_NAME:
+            return await super()._aperform_agent_action(
+                name_to_tool_map, color_mapping, agent_action, run_manager
+            )
+
+        async with get_tool_semaphore():
+            logger.debug(f"Running tool call: {agent_action.tool}")
+            return await super()._aperform_agent_action(
+                name_to_tool_map, color_mapping, agent_action, run_manager
+            )
+
+
+def build_agent_executor(llm, tools, prompt) -> ParallelAgentExecutor:
+    agent = create_tool_calling_agent(llm, tools, prompt)
+    # With stream_runnable=False the agent calls the model through ainvoke,
+    # which consults the global LLM cache (astream bypasses it). Token events
+    # still reach astream_events consumers: the model streams on a cache miss
+    # whenever a streaming callback handler is attached.
+    return ParallelAgentExecutor(
+        agent=RunnableMultiActionAgent(runnable=agent, stream_runnable=False),
+        tools=tools,
+        max_iterations=6,
+        max_execution_time=30,
+        early_stopping_method="force",
+        handle_parsing_errors=True,
+        verbose=os.getenv("VERBOSE") == "1",
+        return_intermediate_steps=False,
+    )
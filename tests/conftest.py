@@ -1,14 +1,31 @@
+import threading
 import pytest
 from unittest.mock import MagicMock, patch
 
+from binance_client import _make_client
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    """Drop cached Binance clients so each test sees its own mocks."""
+    _make_client.cache_clear()
+    yield
+    _make_client.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def shared_binance_client():
+    """One MagicMock reused by every test; mock_binance_client resets it."""
+    return MagicMock()
+
 
 @pytest.fixture
-def mock_binance_client():
+def mock_binance_client(shared_binance_client):
     """Mock BinanceFuturesClient for testing."""
     with patch("binance_client.Client") as mock_client_class:
-        mock_client = MagicMock()
-        mock_client_class.return_value = mock_client
-        yield mock_client
+        mock_client_class.return_value = shared_binance_client
+        yield shared_binance_client
+    shared_binance_client.reset_mock(return_value=True, side_effect=True)
 
 
 @pytest.fixture
@@ -84,3 +101,74 @@ def error_response():
         "data": None,
         "error": {"code": -2019, "message": "Insufficient balance"},
     }
+
+
+class ConcurrencyProbe:
+    """Records the peak number of probe tools running at the same time.
+
+    Each tool holds its slot until ``expected`` tools are inside at once, or
+    until ``timeout`` passes, so overlap is observed without timing asserts.
+    """
+
+    def __init__(self, expected: int, timeout: float):
+        self.expected = expected
+        self.timeout = timeout
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+        self._all_entered = threading.Event()
+
+    def __enter__(self):
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            if self.active >= self.expected:
+                self._all_entered.set()
+        self._all_entered.wait(self.timeout)
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.active -= 1
+
+
+@pytest.fixture
+def probe_tools():
+    """Build fake balance/position tools that report into a ConcurrencyProbe."""
+    from langchain_core.tools import tool
+
+    def make(expected: int = 2, timeout: float = 5.0):
+        probe = ConcurrencyProbe(expected, timeout)
+
+        @tool
+        def slow_balance() -> str:
+            """Slow balance lookup."""
+            with probe:
+                return "balance"
+
+        @tool
+        def slow_position(symbol: str = "BTCUSDT") -> str:
+            """Slow position lookup."""
+            with probe:
+                return f"position {symbol}"
+
+        return probe, [slow_balance, slow_position]
+
+    return make
+
+
+@pytest.fixture
+def counting_llm():
+    """Fresh CountingChatModel for agent tests."""
+    from tests.fakes import CountingChatModel
+
+    return CountingChatModel()
+
+
+@pytest.fixture
+def agent_prompt():
+    """Minimal tool-calling agent prompt."""
+    from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+
+    return ChatPromptTemplate.from_messages(
+        [("human", "{input}"), MessagesPlaceholder(variable_name="agent_scratchpad")]
+    )
@@ -0,0 +1,29 @@
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from pydantic import PrivateAttr
+
+
+class CountingChatModel(BaseChatModel):
+    """Chat model that always answers "done" and counts real generations."""
+
+    _calls: int = PrivateAttr(default=0)
+
+    @property
+    def _llm_type(self):
+        return "counting-fake"
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        self._calls += 1
+        return ChatResult(generations=[ChatGeneration(message=AIMessage("done"))])
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs):
+        self._calls += 1
+        for token in ("do", "ne"):
+            chunk = ChatGenerationChunk(message=AIMessageChunk(content=token))
+            if run_manager:
+                await run_manager.on_llm_new_token(token, chunk=chunk)
+            yield chunk
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import pytest
+from langchain_core.globals import set_llm_cache
+
+from parallel_executor import build_agent_executor
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    import app
+
+    yield app
+    # app installs a process-wide LLM cache at import.
+    set_llm_cache(None)
+
+
+@pytest.fixture
+def agent_loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+def run_stream(app_module, executor, loop, result):
+    return list(
+        app_module.iterate_on_loop(
+            app_module.stream_agent_response(executor, {"input": "hi"}, result),
+            loop,
+        )
+    )
+
+
+class TestStreamAgentResponse:
+    def test_streams_tokens_and_records_output(
+        self, app_module, agent_loop, probe_tools, counting_llm, agent_prompt
+    ):
+        _, tools = probe_tools(expected=1)
+        executor = build_agent_executor(counting_llm, tools, agent_prompt)
+        result = {}
+
+        chunks = run_stream(app_module, executor, agent_loop, result)
+
+        assert "".join(chunks) == "done"
+        assert result["output"] == "done"
+
+    def test_unstreamed_output_is_emitted(
+        self, app_module, agent_loop, probe_tools, counting_llm, agent_prompt
+    ):
+        _, tools = probe_tools(expected=1)
+        executor = build_agent_executor(counting_llm, tools, agent_prompt)
+        executor.max_iterations = 0
+        result = {}
+
+        chunks = run_stream(app_module, executor, agent_loop, result)
+
+        assert result["output"].startswith("Agent stopped")
+        assert "".join(chunks) == result["output"]
+        assert counting_llm._calls == 0
+
+    def test_turns_run_on_the_given_loop(self, app_module, agent_loop):
+        loops = []
+
+        async def agen():
+            loops.append(asyncio.get_running_loop())
+            yield "chunk"
+
+        for _ in range(2):
+            assert list(app_module.iterate_on_loop(agen(), agent_loop)) == ["chunk"]
+
+        assert loops == [agent_loop, agent_loop]
@@ -0,0 +1,99 @@
+import asyncio
+import json
+import sys
+import threading
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import assistant
+import logger
+import main
+
+
+class TestAssistantRepl:
+    def test_turns_share_one_event_loop(self, capsys):
+        loops = []
+        input_threads = []
+
+        async def fake_ainvoke(inputs):
+            loops.append(asyncio.get_running_loop())
+            return {"output": f"echo {inputs['input']}"}
+
+        def fake_input(prompt):
+            input_threads.append(threading.current_thread())
+            return replies.pop(0)
+
+        replies = ["balance", "position", "exit"]
+        agent_executor = MagicMock()
+        agent_executor.ainvoke = fake_ainvoke
+
+        with patch("assistant.create_agent", return_value=agent_executor), patch(
+            "builtins.input", side_effect=fake_input
+        ):
+            assistant.main()
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+        assert input_threads == [threading.main_thread()] * 3
+        output = capsys.readouterr().out
+        assert "Assistant: echo balance" in output
+        assert "Assistant: echo position" in output
+
+
+class TestLoadPrompts:
+    def test_reads_strings_and_input_records(self, tmp_path):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text(
+            '"Check my balance"\n\n{"input": "Position on BTCUSDT?"}\n  \n',
+            encoding="utf-8",
+        )
+
+        assert main.load_prompts(str(path)) == [
+            "Check my balance",
+            "Position on BTCUSDT?",
+        ]
+
+    def test_missing_input_key_raises(self, tmp_path):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('{"prompt": "Check my balance"}\n', encoding="utf-8")
+
+        with pytest.raises(KeyError):
+            main.load_prompts(str(path))
+
+
+class TestRunBatch:
+    def test_maps_results_and_exceptions(self):
+        agent_executor = MagicMock()
+        agent_executor.abatch = AsyncMock(
+            return_value=[{"output": "balance is 10"}, RuntimeError("boom")]
+        )
+
+        with patch("assistant.create_agent", return_value=agent_executor):
+            results = asyncio.run(assistant.run_batch(["balance?", "position?"]))
+
+        assert results == [
+            {"input": "balance?", "output": "balance is 10", "error": None},
+            {"input": "position?", "output": None, "error": "boom"},
+        ]
+        inputs = agent_executor.abatch.await_args.args[0]
+        assert inputs == [
+            {"input": "balance?", "chat_history": []},
+            {"input": "position?", "chat_history": []},
+        ]
+        assert agent_executor.abatch.await_args.kwargs["return_exceptions"] is True
+
+    def test_batch_command_prints_only_json_lines(self, tmp_path, capsys):
+        path = tmp_path / "prompts.jsonl"
+        path.write_text('"balance?"\n', encoding="utf-8")
+        results = [{"input": "balance?", "output": "ok", "error": None}]
+
+        previous = logger.set_console_stream(sys.stdout)
+        try:
+            with patch("assistant.run_batch", AsyncMock(return_value=results)):
+                main.run_batch_command(str(path))
+            assert logger._CONSOLE_HANDLER.stream is sys.stderr
+        finally:
+            logger.set_console_stream(previous)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == results
@@ -0,0 +1,60 @@
+import asyncio
+from langchain_core.tools import tool
+
+import parallel_executor
+from tools.batch_tool import make_batch_tool
+
+
+@tool
+def failing_tool() -> str:
+    """Tool that always fails."""
+    raise RuntimeError("boom")
+
+
+class TestBatchTool:
+    def test_runs_invocations_concurrently(self, monkeypatch, probe_tools):
+        monkeypatch.setattr(parallel_executor, "TOOL_CONCURRENCY_LIMIT", 4)
+        probe, tools = probe_tools()
+        batch = make_batch_tool(tools)
+
+        result = asyncio.run(
+            batch.ainvoke(
+                {
+                    "invocations": [
+                        {"tool_name": "slow_balance", "arguments": {}},
+                        {
+                            "tool_name": "slow_position",
+                            "arguments": {"symbol": "BTCUSDT"},
+                        },
+                    ]
+                }
+            )
+        )
+
+        assert result == "[slow_balance]\nbalance\n\n[slow_position]\nposition BTCUSDT"
+        assert probe.peak == 2
+
+    def test_sync_invoke(self, probe_tools):
+        _, tools = probe_tools(expected=1)
+        batch = make_batch_tool(tools)
+
+        result = batch.invoke(
+            {"invocations": [{"tool_name": "slow_balance", "arguments": {}}]}
+        )
+
+        assert result == "[slow_balance]\nbalance"
+
+    def test_unknown_tool_and_errors_are_reported(self):
+        batch = make_batch_tool([failing_tool])
+
+        result = batch.invoke(
+            {
+                "invocations": [
+                    {"tool_name": "missing_tool", "arguments": {}},
+                    {"tool_name": "failing_tool", "arguments": {}},
+                ]
+            }
+        )
+
+        assert "❌ Unknown tool: missing_tool" in result
+        assert "❌ Error running failing_tool: boom" in result
@@ -1,6 +1,17 @@
 import pytest
-from unittest.mock import MagicMock, patch
-from binance_client import OrderRequest, BinanceFuturesClient
+from unittest.mock import MagicMock, call, patch
+from binance.exceptions import BinanceAPIException, BinanceRequestException
+from binance_client import (
+    BinanceFuturesClient,
+    OrderRequest,
+    _handle_response_orjson,
+    is_retryable_error,
+    retry_on_error,
+)
+
+
+def make_api_exception(status_code, text):
+    return BinanceAPIException(MagicMock(text=text), status_code, text)
 
 
 class TestOrderRequest:
@@ -25,102 +36,197 @@ class TestOrderRequest:
         assert error is None
 
     def test_missing_symbol(self):
-        order = OrderRequest(symbol="", side="BUY", order_type="MARKET", quantity=0.001)
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Symbol is required"
+        with pytest.raises(ValueError, match="Symbol is required"):
+            OrderRequest(symbol="", side="BUY", order_type="MARKET", quantity=0.001)
 
     def test_invalid_side(self):
-        order = OrderRequest(
-            symbol="BTCUSDT", side="HOLD", order_type="MARKET", quantity=0.001
-        )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Side must be BUY or SELL"
+        with pytest.raises(ValueError, match="Side must be BUY or SELL"):
+            OrderRequest(
+                symbol="BTCUSDT", side="HOLD", order_type="MARKET", quantity=0.001
+            )
 
     def test_invalid_order_type(self):
-        order = OrderRequest(
-            symbol="BTCUSDT", side="BUY", order_type="STOP", quantity=0.001
-        )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Order type must be MARKET or LIMIT"
+        with pytest.raises(ValueError, match="Order type must be MARKET or LIMIT"):
+            OrderRequest(
+                symbol="BTCUSDT", side="BUY", order_type="STOP", quantity=0.001
+            )
 
     def test_negative_quantity(self):
-        order = OrderRequest(
-            symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=-0.001
-        )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Quantity must be greater than 0"
+        with pytest.raises(ValueError, match="Quantity must be greater than 0"):
+            OrderRequest(
+                symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=-0.001
+            )
 
     def test_zero_quantity(self):
-        order = OrderRequest(
-            symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=0.0
-        )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Quantity must be greater than 0"
+        with pytest.raises(ValueError, match="Quantity must be greater than 0"):
+            OrderRequest(
+                symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=0.0
+            )
 
     def test_limit_order_without_price(self):
-        order = OrderRequest(
-            symbol="BTCUSDT", side="BUY", order_type="LIMIT", quantity=0.001, price=None
-        )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Price is required for LIMIT orders and must be greater than 0"
+        with pytest.raises(
+            ValueError,
+            match="Price is required for LIMIT orders and must be greater than 0",
+        ):
+            OrderRequest(
+                symbol="BTCUSDT",
+                side="BUY",
+                order_type="LIMIT",
+                quantity=0.001,
+                price=None,
+            )
 
     def test_limit_order_with_negative_price(self):
+        with pytest.raises(
+            ValueError,
+            match="Price is required for LIMIT orders and must be greater than 0",
+        ):
+            OrderRequest(
+                symbol="BTCUSDT",
+                side="BUY",
+                order_type="LIMIT",
+                quantity=0.001,
+                price=-50000.0,
+            )
+
+    def test_case_conversion(self):
+        # OrderRequest does not normalize case; callers must upper-case input.
+        with pytest.raises(ValueError, match="Side must be BUY or SELL"):
+            OrderRequest(
+                symbol="btcusdt", side="buy", order_type="market", quantity=0.001
+            )
+
+    def test_order_is_immutable(self):
         order = OrderRequest(
-            symbol="BTCUSDT",
-            side="BUY",
-            order_type="LIMIT",
-            quantity=0.001,
-            price=-50000.0,
+            symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=0.001
         )
-        is_valid, error = order.validate()
-        assert is_valid is False
-        assert error == "Price is required for LIMIT orders and must be greater than 0"
+        with pytest.raises(AttributeError):
+            order.quantity = 1.0
 
-    def test_case_conversion(self):
+    def test_order_uses_slots(self):
         order = OrderRequest(
-            symbol="btcusdt", side="buy", order_type="market", quantity=0.001
+            symbol="BTCUSDT", side="BUY", order_type="MARKET", quantity=0.001
         )
-        assert order.symbol == "btcusdt"
-        assert order.side == "buy"
-        assert order.order_type == "market"
+        assert OrderRequest.__slots__ == (
+            "symbol",
+            "side",
+            "order_type",
+            "quantity",
+            "price",
+        )
+        assert not hasattr(order, "__dict__")
 
 
-class TestBinanceFuturesClient:
-    @patch("binance_client.Client")
-    def test_initialization(self, mock_client_class):
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+class TestRetryOnError:
+    def test_retryable_status_code(self):
+        e = make_api_exception(502, "<html>Bad Gateway</html>")
+        assert is_retryable_error(e, e.message) is True
 
-        client = BinanceFuturesClient(
-            api_key="test_key", api_secret="test_secret", testnet=True
+    def test_retryable_message(self):
+        e = make_api_exception(400, '{"code": -1, "msg": "503 Service Unavailable"}')
+        assert is_retryable_error(e, e.message) is True
+
+    def test_non_retryable_error(self):
+        e = make_api_exception(400, '{"code": -2019, "msg": "Margin is insufficient."}')
+        assert is_retryable_error(e, e.message) is False
+
+    def test_retries_until_success(self):
+        func = MagicMock(
+            side_effect=[make_api_exception(504, "Gateway Timeout"), "ok"]
         )
-        assert client.testnet is True
-        assert client.client is not None
-        mock_client_class.assert_called_once_with(
-            "test_key", "test_secret", testnet=True
+        wrapped = retry_on_error(max_retries=3, delay=0)(func)
+
+        assert wrapped() == "ok"
+        assert func.call_count == 2
+
+    def test_non_retryable_error_raised_immediately(self):
+        func = MagicMock(
+            side_effect=make_api_exception(
+                400, '{"code": -2019, "msg": "Margin is insufficient."}'
+            )
         )
+        wrapped = retry_on_error(max_retries=3, delay=0)(func)
+
+        with pytest.raises(BinanceAPIException):
+            wrapped()
+        assert func.call_count == 1
+
+    @patch("binance_client.time.sleep")
+    def test_backoff_is_jittered_and_capped(self, mock_sleep):
+        func = MagicMock(
+            side_effect=[make_api_exception(502, "Bad Gateway")] * 4 + ["ok"]
+        )
+        wrapped = retry_on_error(max_retries=5, delay=1, max_delay=2)(func)
+
+        assert wrapped() == "ok"
+        waits = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(waits) == 4
+        assert all(1 <= wait <= 2 for wait in waits)
+
+    def test_gives_up_after_max_retries(self):
+        func = MagicMock(side_effect=make_api_exception(503, "Service Unavailable"))
+        wrapped = retry_on_error(max_retries=3, delay=0)(func)
+
+        with pytest.raises(BinanceAPIException):
+            wrapped()
+        assert func.call_count == 3
 
-    @patch("binance_client.Client")
-    def test_testnet_url(self, mock_client_class):
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
 
+class TestHandleResponse:
+    def test_decodes_json_body(self):
+        response = MagicMock(status_code=200, content=b'{"orderId": 123456}')
+        assert _handle_response_orjson(response) == {"orderId": 123456}
+
+    def test_empty_body(self):
+        response = MagicMock(status_code=200, content=b"")
+        assert _handle_response_orjson(response) == {}
+
+    def test_error_status_raises_api_exception(self):
+        text = '{"code": -2019, "msg": "Margin is insufficient."}'
+        response = MagicMock(status_code=400, content=text.encode(), text=text)
+        with pytest.raises(BinanceAPIException) as exc_info:
+            _handle_response_orjson(response)
+        assert exc_info.value.code == -2019
+
+    def test_invalid_json_raises_request_exception(self):
+        response = MagicMock(status_code=200, content=b"<html>", text="<html>")
+        with pytest.raises(BinanceRequestException):
+            _handle_response_orjson(response)
+
+
+@pytest.fixture(scope="class")
+def mocked_client():
+    """Patch Client and build one testnet BinanceFuturesClient per test class."""
+    with patch("binance_client.Client") as mock_client_class:
         client = BinanceFuturesClient(
             api_key="test_key", api_secret="test_secret", testnet=True
         )
+        yield client, mock_client_class, mock_client_class.call_args
+
+
+@pytest.fixture
+def mock_client_class(mocked_client):
+    """The class-wide Client mock with call history cleared for this test."""
+    _, mock_client_class, _ = mocked_client
+    mock_client_class.reset_mock(side_effect=True)
+    return mock_client_class
+
+
+class TestBinanceFuturesClient:
+    def test_initialization(self, mocked_client):
+        client, mock_client_class, init_call = mocked_client
+
         assert client.testnet is True
+        assert client.client is mock_client_class.return_value
+        assert init_call == call("test_key", "test_secret", testnet=True)
 
-    @patch("binance_client.Client")
-    def test_mainnet_url(self, mock_client_class):
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+    def test_testnet_url(self, mocked_client):
+        client, _, _ = mocked_client
 
+        assert client.testnet is True
+        assert client.client.FUTURES_URL == "https://testnet.binancefuture.com"
+
+    def test_mainnet_url(self, mock_client_class):
         client = BinanceFuturesClient(
             api_key="test_key", api_secret="test_secret", testnet=False
         )
@@ -128,3 +234,29 @@ class TestBinanceFuturesClient:
         mock_client_class.assert_called_once_with(
             "test_key", "test_secret", testnet=False
         )
+
+    def test_client_reused_for_same_credentials(self, mock_client_class):
+        mock_client_instance = mock_client_class.return_value
+
+        first = BinanceFuturesClient(api_key="test_key", api_secret="test_secret")
+        second = BinanceFuturesClient(api_key="test_key", api_secret="test_secret")
+
+        assert first.client is second.client
+        mock_client_class.assert_called_once_with(
+            "test_key", "test_secret", testnet=True
+        )
+        mock_client_instance.session.mount.assert_called_once()
+        prefix, adapter = mock_client_instance.session.mount.call_args.args
+        assert prefix == "https://"
+        assert adapter._pool_maxsize == 32
+        assert adapter.max_retries.connect == 2
+        assert adapter.max_retries.read == 0
+
+    def test_client_not_shared_across_credentials(self, mock_client_class):
+        mock_client_class.side_effect = lambda *args, **kwargs: MagicMock()
+
+        first = BinanceFuturesClient(api_key="key_a", api_secret="secret_a")
+        second = BinanceFuturesClient(api_key="key_b", api_secret="secret_b")
+
+        assert first.client is not second.client
+        assert mock_client_class.call_count == 2
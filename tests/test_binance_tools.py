@@ -0,0 +1,186 @@
+import pytest
+from unittest.mock import patch
+
+from tools import binance_tools, handlers
+
+
+def get_tool(name):
+    return next(t for t in binance_tools.get_tools() if t.name == name)
+
+
+@pytest.fixture
+def mock_tool_client(monkeypatch, mock_binance_client):
+    monkeypatch.setenv("BINANCE_API_KEY", "test_api_key")
+    monkeypatch.setenv("BINANCE_API_SECRET", "test_api_secret")
+    monkeypatch.setattr(binance_tools, "_env_loaded", False)
+    binance_tools.get_client.cache_clear()
+    yield mock_binance_client
+    binance_tools.get_client.cache_clear()
+
+
+class TestBinanceTools:
+    def test_tools_built_once(self):
+        assert binance_tools.get_tools() is binance_tools.get_tools()
+        assert [t.name for t in binance_tools.get_tools()] == [
+            "place_market_order",
+            "place_limit_order",
+            "get_account_balance",
+            "get_position_info",
+            "get_positions_info",
+            "batch",
+        ]
+
+    def test_get_client_is_cached(self, mock_tool_client):
+        assert binance_tools.get_client() is binance_tools.get_client()
+
+    def test_get_client_missing_env_vars(self, monkeypatch):
+        monkeypatch.delenv("BINANCE_API_KEY", raising=False)
+        monkeypatch.delenv("BINANCE_API_SECRET", raising=False)
+        monkeypatch.setattr(binance_tools, "_env_loaded", False)
+        binance_tools.get_client.cache_clear()
+
+        with pytest.raises(ValueError):
+            binance_tools.get_client()
+
+    def test_env_loaded_once(self, monkeypatch):
+        monkeypatch.delenv("BINANCE_API_KEY", raising=False)
+        monkeypatch.delenv("BINANCE_API_SECRET", raising=False)
+        monkeypatch.setattr(binance_tools, "_env_loaded", False)
+
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            binance_tools._init_env()
+            binance_tools._init_env()
+
+        mock_load_dotenv.assert_called_once_with(override=False)
+
+    def test_env_skips_dotenv_when_credentials_set(self, mock_tool_client):
+        with patch("dotenv.load_dotenv") as mock_load_dotenv:
+            binance_tools._init_env()
+
+        mock_load_dotenv.assert_not_called()
+        assert binance_tools._API_KEY == "test_api_key"
+
+    def test_place_market_order(self, mock_tool_client, sample_market_order_response):
+        mock_tool_client.futures_create_order.return_value = (
+            sample_market_order_response["data"]
+        )
+
+        result = get_tool("place_market_order").invoke(
+            {"symbol": "btcusdt", "side": "buy", "quantity": 0.001}
+        )
+
+        assert result == (
+            "✅ MARKET order placed successfully!\n"
+            "Order ID: 123456\n"
+            "Symbol: BTCUSDT\n"
+            "Side: BUY\n"
+            "Status: FILLED\n"
+            "Quantity: 0.001\n"
+            "Executed Qty: 0.001\n"
+            "Avg Price: 50000.00"
+        )
+        mock_tool_client.futures_create_order.assert_called_once_with(
+            symbol="BTCUSDT", side="BUY", type="MARKET", quantity=0.001
+        )
+
+    def test_place_limit_order(self, mock_tool_client, sample_limit_order_response):
+        mock_tool_client.futures_create_order.return_value = (
+            sample_limit_order_response["data"]
+        )
+
+        result = get_tool("place_limit_order").invoke(
+            {"symbol": "ETHUSDT", "side": "SELL", "quantity": 0.5, "price": 3000.0}
+        )
+
+        assert result == (
+            "✅ LIMIT order placed successfully!\n"
+            "Order ID: 789012\n"
+            "Symbol: ETHUSDT\n"
+            "Side: SELL\n"
+            "Status: NEW\n"
+            "Price: 3000.00\n"
+            "Quantity: 0.5\n"
+            "Executed Qty: 0.0\n"
+            "Avg Price: 0.00"
+        )
+
+    def test_invalid_order(self, mock_tool_client):
+        result = get_tool("place_market_order").invoke(
+            {"symbol": "BTCUSDT", "side": "HOLD", "quantity": 0.001}
+        )
+
+        assert result == "❌ Error placing order: Side must be BUY or SELL"
+        mock_tool_client.futures_create_order.assert_not_called()
+
+    def test_upper_reuses_uppercase_strings(self):
+        symbol = "".join(["BTC", "USDT"])
+
+        assert handlers._upper(symbol) is symbol
+        assert handlers._upper("btcusdt") == "BTCUSDT"
+
+    def test_order_failure_response(self, error_response):
+        result = handlers._format_order_response(error_response, "LIMIT")
+
+        assert result == (
+            "❌ Order failed!\n"
+            "Error Code: -2019\n"
+            "Error Message: Insufficient balance"
+        )
+
+    def test_get_account_balance(self, mock_tool_client, sample_account_balance):
+        sample_account_balance["assets"].append(
+            {"asset": "ETH", "walletBalance": "0.0", "availableBalance": "0.0"}
+        )
+        mock_tool_client.futures_account.return_value = sample_account_balance
+
+        result = get_tool("get_account_balance").invoke({})
+
+        assert result == (
+            "📊 Account Balance:\n\n"
+            "Asset: USDT\nWallet Balance: 10000.0\nAvailable Balance: 9500.0\n\n"
+            "Asset: BTC\nWallet Balance: 0.001\nAvailable Balance: 0.001"
+        )
+
+    def test_get_account_balance_empty(self, mock_tool_client):
+        mock_tool_client.futures_account.return_value = {"assets": []}
+
+        result = get_tool("get_account_balance").invoke({})
+
+        assert result == "No balance found in account."
+
+    def test_get_position_info(self, mock_tool_client, sample_position_info):
+        mock_tool_client.futures_position_information.return_value = (
+            sample_position_info
+        )
+
+        result = get_tool("get_position_info").invoke({"symbol": "btcusdt"})
+
+        assert result == (
+            "📈 Position Information for BTCUSDT:\n"
+            "Position Size: 0.001\n"
+            "Entry Price: 49000.00\n"
+            "Mark Price: 50000.00\n"
+            "Unrealized PnL: 1.0\n"
+            "Leverage: 10"
+        )
+        mock_tool_client.futures_position_information.assert_called_once_with(
+            symbol="BTCUSDT"
+        )
+
+    def test_get_positions_info(self, mock_tool_client, sample_position_info):
+        mock_tool_client.futures_position_information.side_effect = lambda symbol: [
+            {**sample_position_info[0], "symbol": symbol}
+        ]
+
+        result = get_tool("get_positions_info").invoke(
+            {"symbols_csv": "btcusdt, ethusdt"}
+        )
+
+        assert result.startswith("📈 Position Information for BTCUSDT:\n")
+        assert "\n\n📈 Position Information for ETHUSDT:\n" in result
+        assert mock_tool_client.futures_position_information.call_count == 2
+
+    def test_get_positions_info_empty(self, mock_tool_client):
+        result = get_tool("get_positions_info").invoke({"symbols_csv": " , "})
+
+        assert result == "No symbols provided."
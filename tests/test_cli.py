@@ -1,7 +1,9 @@
+import logging
 import pytest
-from unittest.mock import MagicMock, patch
-from binance_client import BinanceFuturesClient
+
+import cli as cli_module
 from cli import CLI
+from logger import setup_logger
 
 
 class TestCLI:
@@ -15,13 +17,57 @@ class TestCLI:
         ):
             cli = CLI()
 
-    @patch("binance_client.Client")
-    def test_create_client_success(self, mock_client_class, monkeypatch):
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+    def test_create_client_success(self, mock_binance_client, monkeypatch):
+        monkeypatch.setenv("BINANCE_API_KEY", "test_api_key")
+        monkeypatch.setenv("BINANCE_API_SECRET", "test_api_secret")
+
+        cli = CLI()
+        assert cli.client.client is mock_binance_client
 
+    def test_print_order_response_success(
+        self, mock_binance_client, monkeypatch, capsys, sample_market_order_response
+    ):
         monkeypatch.setenv("BINANCE_API_KEY", "test_api_key")
         monkeypatch.setenv("BINANCE_API_SECRET", "test_api_secret")
 
         cli = CLI()
-        assert cli.client is not None
+        cli._print_order_response(sample_market_order_response)
+
+        out = capsys.readouterr().out
+        assert "Order ID:      123456" in out
+        assert "Avg Price:     50000.00" in out
+        assert out.endswith("✅ Order placed successfully!\n\n")
+
+    def test_print_order_response_failure(
+        self, mock_binance_client, monkeypatch, capsys, error_response
+    ):
+        monkeypatch.setenv("BINANCE_API_KEY", "test_api_key")
+        monkeypatch.setenv("BINANCE_API_SECRET", "test_api_secret")
+
+        cli = CLI()
+        cli._print_order_response(error_response)
+
+        out = capsys.readouterr().out
+        assert "Error Code:    -2019" in out
+        assert "Error Message: Insufficient balance" in out
+        assert out.endswith("❌ Failed to place order!\n\n")
+
+    def test_log_level_warning_suppresses_summary(
+        self, mock_binance_client, monkeypatch, capsys, sample_market_order_response
+    ):
+        monkeypatch.setenv("BINANCE_API_KEY", "test_api_key")
+        monkeypatch.setenv("BINANCE_API_SECRET", "test_api_secret")
+        monkeypatch.setenv("LOG_LEVEL", "WARNING")
+        quiet_logger = setup_logger("tests.cli_log_level_warning")
+        monkeypatch.setattr(cli_module, "logger", quiet_logger)
+        mock_binance_client.futures_create_order.return_value = (
+            sample_market_order_response["data"]
+        )
+
+        CLI().run(symbol="btcusdt", side="buy", order_type="market", quantity=0.001)
+
+        out = capsys.readouterr().out
+        assert quiet_logger.level == logging.WARNING
+        assert "Order Request Summary" not in out
+        assert "=== Order Response ===" in out
+        assert out.endswith("✅ Order placed successfully!\n\n")
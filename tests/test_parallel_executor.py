@@ -0,0 +1,133 @@
+import asyncio
+from langchain_core.agents import AgentAction, AgentFinish
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+from langchain_classic.agents import BaseMultiActionAgent
+
+import parallel_executor
+from parallel_executor import ParallelAgentExecutor, build_agent_executor
+from tools.batch_tool import make_batch_tool
+
+
+class FakeMultiActionAgent(BaseMultiActionAgent):
+    tool_names: list[str]
+    tool_input: dict = {}
+
+    @property
+    def input_keys(self):
+        return ["input"]
+
+    def plan(self, intermediate_steps, callbacks=None, **kwargs):
+        if intermediate_steps:
+            return AgentFinish(
+                {"output": ",".join(str(obs) for _, obs in intermediate_steps)}, ""
+            )
+        return [AgentAction(name, self.tool_input, "") for name in self.tool_names]
+
+    async def aplan(self, intermediate_steps, callbacks=None, **kwargs):
+        return self.plan(intermediate_steps, callbacks, **kwargs)
+
+
+class TestParallelAgentExecutor:
+    def test_tool_calls_run_concurrently(self, monkeypatch, probe_tools):
+        monkeypatch.setattr(parallel_executor, "TOOL_CONCURRENCY_LIMIT", 4)
+        probe, tools = probe_tools()
+        executor = ParallelAgentExecutor(
+            agent=FakeMultiActionAgent(tool_names=[t.name for t in tools]),
+            tools=tools,
+        )
+
+        response = asyncio.run(executor.ainvoke({"input": "balance and position"}))
+
+        assert response["output"] == "balance,position BTCUSDT"
+        assert probe.peak == 2
+
+    def test_concurrency_limit(self, monkeypatch, probe_tools):
+        monkeypatch.setattr(parallel_executor, "TOOL_CONCURRENCY_LIMIT", 1)
+        probe, tools = probe_tools(timeout=0.1)
+        executor = ParallelAgentExecutor(
+            agent=FakeMultiActionAgent(tool_names=[t.name for t in tools]),
+            tools=tools,
+        )
+
+        asyncio.run(executor.ainvoke({"input": "balance and position"}))
+
+        assert probe.peak == 1
+
+    def test_batch_calls_share_the_limit(self, monkeypatch, probe_tools):
+        monkeypatch.setattr(parallel_executor, "TOOL_CONCURRENCY_LIMIT", 2)
+        probe, tools = probe_tools(expected=4, timeout=0.1)
+        executor = ParallelAgentExecutor(
+            agent=FakeMultiActionAgent(
+                tool_names=["batch", "batch"],
+                tool_input={
+                    "invocations": [
+                        {"tool_name": t.name, "arguments": {}} for t in tools
+                    ]
+                },
+            ),
+            tools=[*tools, make_batch_tool(tools)],
+        )
+
+        asyncio.run(executor.ainvoke({"input": "balance and position, twice"}))
+
+        assert probe.peak == 2
+
+    def test_batch_does_not_deadlock_at_limit_one(self, monkeypatch, probe_tools):
+        monkeypatch.setattr(parallel_executor, "TOOL_CONCURRENCY_LIMIT", 1)
+        probe, tools = probe_tools(timeout=0.1)
+        executor = ParallelAgentExecutor(
+            agent=FakeMultiActionAgent(
+                tool_names=["batch"],
+                tool_input={
+                    "invocations": [
+                        {"tool_name": t.name, "arguments": {}} for t in tools
+                    ]
+                },
+            ),
+            tools=[*tools, make_batch_tool(tools)],
+        )
+
+        response = asyncio.run(executor.ainvoke({"input": "balance and position"}))
+
+        assert "[slow_balance]\nbalance" in response["output"]
+        assert "[slow_position]\nposition BTCUSDT" in response["output"]
+        assert probe.peak == 1
+
+
+class TestBuildAgentExecutor:
+    def test_repeated_prompt_served_from_llm_cache(
+        self, probe_tools, counting_llm, agent_prompt
+    ):
+        _, tools = probe_tools(expected=1)
+        executor = build_agent_executor(counting_llm, tools, agent_prompt)
+
+        set_llm_cache(InMemoryCache())
+        try:
+            outputs = [
+                asyncio.run(executor.ainvoke({"input": "balance?"}))["output"]
+                for _ in range(2)
+            ]
+        finally:
+            set_llm_cache(None)
+
+        assert outputs == ["done", "done"]
+        assert counting_llm._calls == 1
+
+    def test_tokens_still_streamed_on_cache_miss(
+        self, probe_tools, counting_llm, agent_prompt
+    ):
+        _, tools = probe_tools(expected=1)
+        executor = build_agent_executor(counting_llm, tools, agent_prompt)
+
+        async def collect():
+            tokens = [
+                event["data"]["chunk"].content
+                async for event in executor.astream_events(
+                    {"input": "balance?"}, version="v2"
+                )
+                if event["event"] == "on_chat_model_stream"
+            ]
+            return "".join(tokens)
+
+        assert asyncio.run(collect()) == "done"
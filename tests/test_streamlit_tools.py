@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import patch
+
+from tools import streamlit_tools
+
+
+def get_tool(name):
+    return next(t for t in streamlit_tools.get_tools() if t.name == name)
+
+
+@pytest.fixture(autouse=True)
+def clear_streamlit_clients():
+    streamlit_tools.get_client.cache_clear()
+    yield
+    streamlit_tools.get_client.cache_clear()
+
+
+class TestStreamlitTools:
+    def test_get_client_cached_per_credentials(self, mock_binance_client):
+        client = streamlit_tools.get_client("key_a", "secret_a")
+
+        assert streamlit_tools.get_client("key_a", "secret_a") is client
+        assert streamlit_tools.get_client("key_b", "secret_b") is not client
+
+    def test_place_market_order_uses_passed_credentials(
+        self, sample_market_order_response
+    ):
+        with patch("tools.streamlit_tools.BinanceFuturesClient") as mock_client_class:
+            mock_client_class.return_value.place_order.return_value = (
+                sample_market_order_response
+            )
+
+            result = get_tool("place_market_order").invoke(
+                {
+                    "symbol": "btcusdt",
+                    "side": "buy",
+                    "quantity": 0.001,
+                    "api_key": "key_a",
+                    "api_secret": "secret_a",
+                }
+            )
+
+        mock_client_class.assert_called_once_with("key_a", "secret_a", testnet=True)
+        order = mock_client_class.return_value.place_order.call_args.args[0]
+        assert (order.symbol, order.side, order.quantity) == ("BTCUSDT", "BUY", 0.001)
+        assert result.startswith(
+            "✅ MARKET order placed successfully!\nOrder ID: 123456"
+        )
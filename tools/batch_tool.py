@@ -0,0 +1,64 @@
+import asyncio
+
+from langchain_core.tools import BaseTool, StructuredTool
+from pydantic import BaseModel, Field
+
+from logger import setup_logger
+from parallel_executor import BATCH_TOOL_NAME, get_tool_semaphore
+
+logger = setup_logger(__name__)
+
+
+class ToolInvocation(BaseModel):
+    tool_name: str = Field(description="Name of the tool to call")
+    arguments: dict = Field(
+        default_factory=dict, description="Arguments to pass to the tool"
+    )
+
+
+class BatchInput(BaseModel):
+    invocations: list[ToolInvocation] = Field(
+        description="Independent tool calls to run together"
+    )
+
+
+def make_batch_tool(tools: list[BaseTool]) -> BaseTool:
+    tools_by_name = {t.name: t for t in tools}
+
+    async def run_invocation(invocation: ToolInvocation) -> str:
+        tool = tools_by_name.get(invocation.tool_name)
+        if tool is None:
+            logger.error(f"Batch requested unknown tool: {invocation.tool_name}")
+            return f"❌ Unknown tool: {invocation.tool_name}"
+
+        async with get_tool_semaphore():
+            try:
+                return await tool.ainvoke(invocation.arguments)
+            except Exception as e:
+                logger.error(f"Error running {invocation.tool_name} in batch: {str(e)}")
+                return f"❌ Error running {invocation.tool_name}: {str(e)}"
+
+    async def abatch(invocations: list[ToolInvocation]) -> str:
+        logger.info(f"Tool invoked: batch({len(invocations)} invocations)")
+        results = await asyncio.gather(
+            *[run_invocation(invocation) for invocation in invocations]
+        )
+        return "\n\n".join(
+            f"[{invocation.tool_name}]\n{result}"
+            for invocation, result in zip(invocations, results)
+        )
+
+    def batch(invocations: list[ToolInvocation]) -> str:
+        return asyncio.run(abatch(invocations))
+
+    return StructuredTool.from_function(
+        func=batch,
+        coroutine=abatch,
+        name=BATCH_TOOL_NAME,
+        description=(
+            "Run several independent tool calls concurrently in one step. "
+            "Each invocation names a tool and its arguments. "
+            f"Available tools: {', '.join(tools_by_name)}"
+        ),
+        args_schema=BatchInput,
+    )
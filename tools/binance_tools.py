@@ -1,228 +1,152 @@
 import os
 import logging
+import threading
+from functools import lru_cache
 from typing import Optional
 
-from binance_client import BinanceFuturesClient, OrderRequest
-from langchain_core.tools import tool
-from dotenv import load_dotenv
+from binance_client import BinanceFuturesClient
 
 from logger import setup_logger
+from tools.handlers import (
+    run_account_balance,
+    run_limit_order,
+    run_market_order,
+    run_position_info,
+    run_positions_info,
+)
+
+__all__ = ("get_tools",)
 
 logger = setup_logger(__name__)
-load_dotenv()
 
+_env_lock = threading.Lock()
+_env_loaded = False
+_API_KEY: Optional[str] = None
+_API_SECRET: Optional[str] = None
 
-def get_client() -> BinanceFuturesClient:
-    api_key = os.getenv("BINANCE_API_KEY")
-    api_secret = os.getenv("BINANCE_API_SECRET")
 
-    if not api_key or not api_secret:
-        logger.error(
-            "BINANCE_API_KEY and BINANCE_API_SECRET environment variables are required"
-        )
-        raise ValueError(
-            "BINANCE_API_KEY and BINANCE_API_SECRET environment variables are required"
-        )
+def _init_env() -> None:
+    # Load .env and resolve the credentials exactly once per process.
+    global _env_loaded, _API_KEY, _API_SECRET
+    if _env_loaded:
+        return
 
-    return BinanceFuturesClient(api_key, api_secret, testnet=True)
+    with _env_lock:
+        if _env_loaded:
+            return
+        # Skip parsing .env when the credentials are already in the environment,
+        # e.g. in worker processes that inherited them.
+        if not (os.getenv("BINANCE_API_KEY") and os.getenv("BINANCE_API_SECRET")):
+            from dotenv import load_dotenv
 
+            load_dotenv(override=False)
+        _API_KEY = os.getenv("BINANCE_API_KEY")
+        _API_SECRET = os.getenv("BINANCE_API_SECRET")
+        _env_loaded = True
 
-@tool
-def place_market_order(symbol: str, side: str, quantity: float) -> str:
-    """
-    Place a MARKET order on Binance Futures Testnet.
 
-    Args:
-        symbol: Trading pair symbol (e.g., BTCUSDT)
-        side: Order side - either 'BUY' or 'SELL'
-        quantity: Order quantity
-
-    Returns:
-        Order response details including orderId, status, executedQty, avgPrice
-    """
-    logger.info(f"Tool invoked: place_market_order({symbol}, {side}, {quantity})")
+# One client per process; tool calls reuse it and its connection pool.
+@lru_cache(maxsize=1)
+def get_client() -> BinanceFuturesClient:
+    _init_env()
 
-    try:
-        client = get_client()
-        order = OrderRequest(
-            symbol=symbol.upper(),
-            side=side.upper(),
-            order_type="MARKET",
-            quantity=quantity,
+    if not _API_KEY or not _API_SECRET:
+        logger.error(
+            "BINANCE_API_KEY and BINANCE_API_SECRET environment variables are required"
         )
-
-        response = client.place_order(order)
-
-        if response["success"]:
-            data = response["data"]
-            logger.info(
-                f"Market order placed successfully. Order ID: {data.get('orderId')}"
-            )
-            return (
-                f"✅ MARKET order placed successfully!\n"
-                f"Order ID: {data.get('orderId', 'N/A')}\n"
-                f"Symbol: {data.get('symbol', 'N/A')}\n"
-                f"Side: {data.get('side', 'N/A')}\n"
-                f"Status: {data.get('status', 'N/A')}\n"
-                f"Quantity: {data.get('origQty', 'N/A')}\n"
-                f"Executed Qty: {data.get('executedQty', 'N/A')}\n"
-                f"Avg Price: {data.get('avgPrice', 'N/A')}"
-            )
-        else:
-            error = response["error"]
-            logger.error(
-                f"Market order failed: {error.get('message')} (code: {error.get('code')})"
-            )
-            return (
-                f"❌ Order failed!\n"
-                f"Error Code: {error.get('code', 'N/A')}\n"
-                f"Error Message: {error.get('message', 'N/A')}"
-            )
-    except Exception as e:
-        logger.error(f"Error placing market order: {str(e)}")
-        return f"❌ Error placing order: {str(e)}"
-
-
-@tool
-def place_limit_order(symbol: str, side: str, quantity: float, price: float) -> str:
-    """
-    Place a LIMIT order on Binance Futures Testnet.
-
-    Args:
-        symbol: Trading pair symbol (e.g., BTCUSDT)
-        side: Order side - either 'BUY' or 'SELL'
-        quantity: Order quantity
-        price: Limit price for the order
-
-    Returns:
-        Order response details including orderId, status, executedQty, avgPrice
-    """
-    logger.info(
-        f"Tool invoked: place_limit_order({symbol}, {side}, {quantity}, {price})"
-    )
-
-    try:
-        client = get_client()
-        order = OrderRequest(
-            symbol=symbol.upper(),
-            side=side.upper(),
-            order_type="LIMIT",
-            quantity=quantity,
-            price=price,
+        raise ValueError(
+            "BINANCE_API_KEY and BINANCE_API_SECRET environment variables are required"
         )
 
-        response = client.place_order(order)
-
-        if response["success"]:
-            data = response["data"]
-            logger.info(
-                f"Limit order placed successfully. Order ID: {data.get('orderId')}"
-            )
-            return (
-                f"✅ LIMIT order placed successfully!\n"
-                f"Order ID: {data.get('orderId', 'N/A')}\n"
-                f"Symbol: {data.get('symbol', 'N/A')}\n"
-                f"Side: {data.get('side', 'N/A')}\n"
-                f"Status: {data.get('status', 'N/A')}\n"
-                f"Price: {data.get('price', 'N/A')}\n"
-                f"Quantity: {data.get('origQty', 'N/A')}\n"
-                f"Executed Qty: {data.get('executedQty', 'N/A')}\n"
-                f"Avg Price: {data.get('avgPrice', 'N/A')}"
-            )
-        else:
-            error = response["error"]
-            logger.error(
-                f"Limit order failed: {error.get('message')} (code: {error.get('code')})"
-            )
-            return (
-                f"❌ Order failed!\n"
-                f"Error Code: {error.get('code', 'N/A')}\n"
-                f"Error Message: {error.get('message', 'N/A')}"
-            )
-    except Exception as e:
-        logger.error(f"Error placing limit order: {str(e)}")
-        return f"❌ Error placing order: {str(e)}"
-
-
-@tool
-def get_account_balance() -> str:
-    """
-    Get the account balance for Binance Futures Testnet.
-
-    Returns:
-        Account balance information including available balance and asset details
-    """
-    logger.info("Tool invoked: get_account_balance()")
-
-    try:
-        client = get_client()
-        account_info = client.client.futures_account()
-        logger.debug("Account info retrieved successfully")
-
-        balance_info = []
-        for balance in account_info.get("assets", []):
-            if float(balance["walletBalance"]) > 0:
-                balance_info.append(
-                    f"Asset: {balance['asset']}\n"
-                    f"Wallet Balance: {balance['walletBalance']}\n"
-                    f"Available Balance: {balance['availableBalance']}"
-                )
-
-        if balance_info:
-            logger.info(
-                f"Account balance retrieved: {len(balance_info)} assets with non-zero balance"
-            )
-            return "📊 Account Balance:\n\n" + "\n\n".join(balance_info)
-        else:
-            logger.warning("No balance found in account")
-            return "No balance found in account."
-
-    except Exception as e:
-        logger.error(f"Error fetching account balance: {str(e)}")
-        return f"❌ Error fetching account balance: {str(e)}"
-
-
-@tool
-def get_position_info(symbol: str) -> str:
-    """
-    Get position information for a specific trading pair.
-
-    Args:
-        symbol: Trading pair symbol (e.g., BTCUSDT)
-
-    Returns:
-        Position details including position size, entry price, unrealized profit/loss
-    """
-    logger.info(f"Tool invoked: get_position_info({symbol})")
-
-    try:
-        client = get_client()
-        positions = client.client.futures_position_information(symbol=symbol.upper())
-        logger.debug(f"Position info retrieved for {symbol}")
-
-        if positions:
-            pos = positions[0]
-            if float(pos["positionAmt"]) != 0:
-                logger.info(f"Position found for {symbol}: {pos['positionAmt']} units")
-                return (
-                    f"📈 Position Information for {pos['symbol']}:\n"
-                    f"Position Size: {pos['positionAmt']}\n"
-                    f"Entry Price: {pos['entryPrice']}\n"
-                    f"Mark Price: {pos['markPrice']}\n"
-                    f"Unrealized PnL: {pos['unRealizedProfit']}\n"
-                    f"Leverage: {pos['leverage']}"
-                )
-            else:
-                logger.info(f"No open position for {symbol}")
-                return f"No open position for {symbol}"
-        else:
-            logger.warning(f"No position information found for {symbol}")
-            return f"No position information found for {symbol}"
-
-    except Exception as e:
-        logger.error(f"Error fetching position info: {str(e)}")
-        return f"❌ Error fetching position info: {str(e)}"
-
-
-tools = [place_market_order, place_limit_order, get_account_balance, get_position_info]
-logger.info(f"Binance tools loaded: {len(tools)} tools available")
+    return BinanceFuturesClient(_API_KEY, _API_SECRET, testnet=True)
+
+
+# LangChain (and pydantic) are only imported once the agent asks for tools, so
+# CLI paths that never touch the agent skip that import cost.
+def _build_tools() -> list:
+    from langchain_core.tools import tool
+
+    from tools.batch_tool import make_batch_tool
+
+    @tool
+    def place_market_order(symbol: str, side: str, quantity: float) -> str:
+        """
+        Place a MARKET order on Binance Futures Testnet.
+
+        Args:
+            symbol: Trading pair symbol (e.g., BTCUSDT)
+            side: Order side - either 'BUY' or 'SELL'
+            quantity: Order quantity
+
+        Returns:
+            Order response details including orderId, status, executedQty, avgPrice
+        """
+        return run_market_order(get_client, symbol, side, quantity)
+
+    @tool
+    def place_limit_order(symbol: str, side: str, quantity: float, price: float) -> str:
+        """
+        Place a LIMIT order on Binance Futures Testnet.
+
+        Args:
+            symbol: Trading pair symbol (e.g., BTCUSDT)
+            side: Order side - either 'BUY' or 'SELL'
+            quantity: Order quantity
+            price: Limit price for the order
+
+        Returns:
+            Order response details including orderId, status, executedQty, avgPrice
+        """
+        return run_limit_order(get_client, symbol, side, quantity, price)
+
+    @tool
+    def get_account_balance() -> str:
+        """
+        Get the account balance for Binance Futures Testnet.
+
+        Returns:
+            Account balance information including available balance and asset details
+        """
+        return run_account_balance(get_client)
+
+    @tool
+    def get_position_info(symbol: str) -> str:
+        """
+        Get position information for a specific trading pair.
+
+        Args:
+            symbol: Trading pair symbol (e.g., BTCUSDT)
+
+        Returns:
+            Position details including position size, entry price, unrealized profit/loss
+        """
+        return run_position_info(get_client, symbol)
+
+    @tool
+    def get_positions_info(symbols_csv: str) -> str:
+        """
+        Get position information for several trading pairs at once.
+
+        Args:
+            symbols_csv: Comma-separated trading pair symbols (e.g., BTCUSDT,ETHUSDT)
+
+        Returns:
+            Position details for each symbol, looked up concurrently
+        """
+        return run_positions_info(get_client, symbols_csv)
+
+    built = [
+        place_market_order,
+        place_limit_order,
+        get_account_balance,
+        get_position_info,
+        get_positions_info,
+    ]
+    built.append(make_batch_tool(built))
+    logger.info(f"Binance tools loaded: {len(built)} tools available")
+    return built
+
+
+@lru_cache(maxsize=1)
+def get_tools() -> list:
+    return _build_tools()
@@ -0,0 +1,182 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
+
+from binance_client import OrderRequest
+from logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# python-binance is blocking, so multi-symbol lookups fan out on threads.
+_POSITION_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="positions")
+
+_MARKET_OK_TMPL = (
+    "✅ MARKET order placed successfully!\n"
+    "Order ID: {orderId}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Status: {status}\n"
+    "Quantity: {origQty}\n"
+    "Executed Qty: {executedQty}\n"
+    "Avg Price: {avgPrice}"
+)
+
+_LIMIT_OK_TMPL = (
+    "✅ LIMIT order placed successfully!\n"
+    "Order ID: {orderId}\n"
+    "Symbol: {symbol}\n"
+    "Side: {side}\n"
+    "Status: {status}\n"
+    "Price: {price}\n"
+    "Quantity: {origQty}\n"
+    "Executed Qty: {executedQty}\n"
+    "Avg Price: {avgPrice}"
+)
+
+_ORDER_OK_TMPLS = {"MARKET": _MARKET_OK_TMPL, "LIMIT": _LIMIT_OK_TMPL}
+
+_ORDER_FAILED_TMPL = "❌ Order failed!\nError Code: {code}\nError Message: {message}"
+
+_BALANCE_TMPL = (
+    "Asset: {asset}\n"
+    "Wallet Balance: {walletBalance}\n"
+    "Available Balance: {availableBalance}"
+)
+
+_POSITION_TMPL = (
+    "📈 Position Information for {symbol}:\n"
+    "Position Size: {positionAmt}\n"
+    "Entry Price: {entryPrice}\n"
+    "Mark Price: {markPrice}\n"
+    "Unrealized PnL: {unRealizedProfit}\n"
+    "Leverage: {leverage}"
+)
+
+
+def _upper(s: str) -> str:
+    # Symbols and sides usually arrive uppercase already; skip the copy then.
+    return s if s.isascii() and s.isupper() else s.upper()
+
+
+def _with_defaults(data: dict) -> defaultdict:
+    return defaultdict(lambda: "N/A", data)
+
+
+def _format_order_response(response: dict, order_type: str) -> str:
+    label = order_type.capitalize()
+
+    if response["success"]:
+        data = response["data"]
+        logger.info(
+            f"{label} order placed successfully. Order ID: {data.get('orderId')}"
+        )
+        return _ORDER_OK_TMPLS[order_type].format_map(_with_defaults(data))
+    else:
+        error = response["error"]
+        logger.error(
+            f"{label} order failed: {error.get('message')} (code: {error.get('code')})"
+        )
+        return _ORDER_FAILED_TMPL.format_map(_with_defaults(error))
+
+
+def _run_order(
+    client_factory,
+    order_type: str,
+    symbol: str,
+    side: str,
+    quantity: float,
+    price: Optional[float] = None,
+) -> str:
+    try:
+        client = client_factory()
+        order = OrderRequest(
+            symbol=_upper(symbol),
+            side=_upper(side),
+            order_type=order_type,
+            quantity=quantity,
+            price=price,
+        )
+
+        response = client.place_order(order)
+        return _format_order_response(response, order_type)
+    except Exception as e:
+        logger.error(f"Error placing {order_type.lower()} order: {str(e)}")
+        return f"❌ Error placing order: {str(e)}"
+
+
+def run_market_order(client_factory, symbol: str, side: str, quantity: float) -> str:
+    logger.info(f"Tool invoked: place_market_order({symbol}, {side}, {quantity})")
+    return _run_order(client_factory, "MARKET", symbol, side, quantity)
+
+
+def run_limit_order(
+    client_factory, symbol: str, side: str, quantity: float, price: float
+) -> str:
+    logger.info(
+        f"Tool invoked: place_limit_order({symbol}, {side}, {quantity}, {price})"
+    )
+    return _run_order(client_factory, "LIMIT", symbol, side, quantity, price)
+
+
+def run_account_balance(client_factory) -> str:
+    logger.info("Tool invoked: get_account_balance()")
+
+    try:
+        client = client_factory()
+        account_info = client.client.futures_account()
+        logger.debug("Account info retrieved successfully")
+
+        body = "\n\n".join(
+            _BALANCE_TMPL.format_map(balance)
+            for balance in account_info.get("assets", ())
+            if float(balance["walletBalance"]) > 0
+        )
+
+        if body:
+            logger.info("Account balance retrieved")
+            return "📊 Account Balance:\n\n" + body
+        else:
+            logger.warning("No balance found in account")
+            return "No balance found in account."
+
+    except Exception as e:
+        logger.error(f"Error fetching account balance: {str(e)}")
+        return f"❌ Error fetching account balance: {str(e)}"
+
+
+def run_position_info(client_factory, symbol: str) -> str:
+    logger.info(f"Tool invoked: get_position_info({symbol})")
+
+    try:
+        client = client_factory()
+        positions = client.client.futures_position_information(symbol=_upper(symbol))
+        logger.debug(f"Position info retrieved for {symbol}")
+
+        if positions:
+            pos = positions[0]
+            if float(pos["positionAmt"]) != 0:
+                logger.info(f"Position found for {symbol}: {pos['positionAmt']} units")
+                return _POSITION_TMPL.format_map(pos)
+            else:
+                logger.info(f"No open position for {symbol}")
+                return f"No open position for {symbol}"
+        else:
+            logger.warning(f"No position information found for {symbol}")
+            return f"No position information found for {symbol}"
+
+    except Exception as e:
+        logger.error(f"Error fetching position info: {str(e)}")
+        return f"❌ Error fetching position info: {str(e)}"
+
+
+def run_positions_info(client_factory, symbols_csv: str) -> str:
+    logger.info(f"Tool invoked: get_positions_info({symbols_csv})")
+
+    symbols = [s.strip() for s in symbols_csv.split(",") if s.strip()]
+    if not symbols:
+        return "No symbols provided."
+
+    return "\n\n".join(
+        _POSITION_EXECUTOR.map(partial(run_position_info, client_factory), symbols)
+    )